@@ -1,3 +1,3 @@
-from .extractor import Crawler, TrackingItem
+from .extractor import Crawler, Extractor, Fetcher, TrackingItem
 
-__all__ = ['Crawler', 'TrackingItem']
+__all__ = ['Crawler', 'Extractor', 'Fetcher', 'TrackingItem']
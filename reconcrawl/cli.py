@@ -13,7 +13,9 @@ def cli():
     parser.add_argument("url", help="URL of the website to analyze")
     parser.add_argument("--max-pages", "-mp", type=int, default=50, help="Maximum number of pages to crawl (default: 50)")
     parser.add_argument("--timeout", "-t", type=int, default=30, help="Request timeout in seconds (default: 30)")
-    parser.add_argument("--delay", "-d", type=float, default=1.0, help="Delay between requests in seconds (default: 1.0)")
+    parser.add_argument("--delay", "-d", type=float, default=1.0, help="Delay between requests to the same host in seconds (default: 1.0)")
+    parser.add_argument("--concurrency", "-c", type=int, default=16, help="Maximum number of pages fetched at the same time (default: 16)")
+    parser.add_argument("--workers", "-w", type=int, default=0, help="Number of processes used to parse pages (default: 0, parse in the main process)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Print every page being searched")
     parser.add_argument("--verify_ssl", "-vssl", action="store_true", help="Whether to verify SSL certificates (default: True)")
     parser.add_argument("--recursive", "-r", action="store_true", help="Follow every internal link (default: only crawl the final page after redirects)")
@@ -27,7 +29,9 @@ def cli():
         delay=args.delay,
         verbose=args.verbose,
         recursive=args.recursive,
-        verify_ssl=args.verify_ssl
+        verify_ssl=args.verify_ssl,
+        concurrency=args.concurrency,
+        workers=args.workers
     )
     
     try:
@@ -70,6 +74,8 @@ def cli():
         print("\n⏹️ Crawling interrupted by user")
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
+    finally:
+        crawler.close()
 
 if __name__ == "__main__":
     cli()
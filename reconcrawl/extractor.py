@@ -1,13 +1,108 @@
+import asyncio
+import aiohttp
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from functools import lru_cache
+from itertools import chain
 import requests
+import posixpath
 import re
-from bs4 import BeautifulSoup
+import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 from urllib.parse import urljoin, urlparse
-from typing import List, Set, Dict
+from typing import Iterable, Iterator, List, Optional, Set, Dict, Tuple, Union
 from dataclasses import dataclass
-import time
 
+try:
+    import re2
+except ImportError:
+    re2 = None
 
-@dataclass
+
+def _compile_scanner(pattern: Union[str, bytes]):
+    """
+    Compile a pattern used to scan whole pages, with RE2 when it is installed.
+    
+    RE2 runs in linear time and is much faster than re on large texts, but its \\d and \\s
+    only match ASCII, so in str patterns they are widened to the Unicode classes re uses
+    (every \\s in these patterns sits inside a character class). RE2 does not take re
+    flags, so patterns set them inline, e.g. (?i:...). Patterns RE2 does not support
+    (lookarounds, backreferences...) are compiled with re, unchanged.
+    """
+    if re2 is not None:
+        re2_pattern = pattern
+        if isinstance(pattern, str):
+            re2_pattern = pattern.replace(r'\d', r'\p{Nd}').replace(r'\s', r'\x{9}-\x{d}\x{1c}-\x{20}\x{85}\p{Z}')
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(re2_pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+class _DigitsOnlyTable(dict):
+    """
+    str.translate table that deletes every character except decimal digits.
+    
+    Same result as re.sub(r'\\D', '', text), without the regex engine. Entries are added
+    the first time a character is looked up, so the table stays small.
+    """
+    
+    def __missing__(self, code_point: int):
+        value = code_point if chr(code_point).isdecimal() else None
+        self[code_point] = value
+        return value
+
+
+_DIGITS_ONLY = _DigitsOnlyTable()
+
+# Patterns are compiled once at import time instead of on every call
+_MAILTO_RE = re.compile(r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})', re.IGNORECASE)
+# Only the prefix is case-insensitive: RE2 folds case with Unicode rules over UTF-8 bytes, so a global (?i)
+# would let [A-Za-z] match non-ASCII letters such as the Kelvin sign
+_MAILTO_BYTES_RE = _compile_scanner(rb'(?i:mailto:)([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SEPARATORS_RE = re.compile(r'[-.]+')
+_PARENTHESES_RE = re.compile(r'[()]')
+_PHONE_SEPARATOR_RE = re.compile(r'[\s\-\.\(\)\+]')
+_COUNTRY_CODE_RE = re.compile(r'(\+\d{1,4})(.*)')
+_NUMBER_SEPARATOR_RE = re.compile(r'[\s\-\.\(\)]')
+# Links that are not worth crawling: documents and assets, and account pages
+_EXCLUDED_EXTENSIONS = frozenset({'.pdf', '.doc', '.docx', '.jpg', '.jpeg', '.png', '.gif', '.css', '.js', '.xml', '.rss'})
+_EXCLUDED_PATH_RE = re.compile(r'(?<![a-z])(?:logout|admin|login|register|signup|signin)(?![a-z])', re.IGNORECASE)
+# Elements whose text is not shown on the page
+_NON_TEXT_TAGS = frozenset({'script', 'style'})
+_LINK_HREFS = etree.XPath('//a/@href', smart_strings=False)
+_MAILTO_HREFS = etree.XPath('//a/@href[starts-with(translate(., "MAILTO", "mailto"), "mailto:")]', smart_strings=False)
+# Characters urlparse strips from the start of a URL, and the ones it removes anywhere
+_C0_CONTROL_OR_SPACE = ''.join(map(chr, range(0x21)))
+_URL_CHARS_TO_REMOVE = str.maketrans('', '', '\t\r\n')
+# Pages are truncated past this size instead of being read into memory whole
+_MAX_PAGE_BYTES = 2_000_000
+# Shortest text that can hold a match ("a@b.co"); phone numbers need at least 10 digits
+_MIN_CONTACT_LENGTH = 6
+_MIN_PHONE_DIGITS = 10
+# Emails and the three phone formats as one alternation, so page text is scanned in a single pass.
+# The +1 branch comes before the international one so US numbers keep their +1-XXX-XXX-XXXX format.
+_CONTACT_RE = _compile_scanner(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<us_cc>\+1[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b)'
+    r'|(?P<us>\b\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b)'
+    r'|(?P<intl>\+\d{1,4}[\s.-]?(?:\(?\d{1,4}\)?[\s.-]?){2,6}\d{2,4}\b)'
+)
+
+
+# Items are stored without a per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TrackingItem:
     """Represents a found tracking item (email or phone)."""
     type: str
@@ -15,87 +110,196 @@ class TrackingItem:
     source_url: str = ""
 
 
-class Crawler:
-    """A web crawler that extracts emails and phone numbers from websites."""
+@lru_cache(maxsize=32)
+def _html_parser(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """Return an HTML parser for the given encoding, shared across pages."""
+    return lxml_html.HTMLParser(encoding=encoding)
+
+
+def _iter_text_nodes(tree: lxml_html.HtmlElement) -> Iterator[str]:
+    """
+    Yield the text nodes of a page in document order, leaving out scripts, stylesheets and comments.
     
-    def __init__(self, url: str, max_pages: int = 50, timeout: int = 30, delay: float = 1.0, verbose: bool = False, recursive: bool = False, verify_ssl: bool = True):
-        """
-        Initialize the crawler.
-        
-        Args:
-            url: The URL to crawl
-            max_pages: Maximum number of pages to crawl
-            timeout: Request timeout in seconds
-            delay: Delay between requests in seconds
-            verbose: Print every page being searched
-            recursive: Follow every internal link (default: only crawl the final page after redirects)
-            verify_ssl: Whether to verify SSL certificates (default: True)
-        """
-        self.url = url
-        self.max_pages = max_pages
+    The tree is walked lazily, so only one node is held at a time instead of a list of the whole page text.
+    """
+    # Comments and processing instructions only report a single event; their own text is skipped but not their tail
+    for event, node in etree.iterwalk(tree, events=('start', 'end', 'comment', 'pi')):
+        if event == 'start':
+            if node.text and node.tag not in _NON_TEXT_TAGS:
+                yield node.text
+        elif node.tail and node is not tree:
+            yield node.tail
+
+
+@lru_cache(maxsize=65536)
+def _normalize_url_cached(url: str) -> str:
+    """
+    Normalize a URL for deduplication, memoized since the same links show up on most pages.
+    
+    Results are interned, so aliases of a page (trailing slash, fragment, query...) share one
+    string and set lookups on them succeed on the identity check.
+    """
+    # urlparse drops leading control characters and spaces, and tabs and newlines anywhere in the URL;
+    # clean them first, since the start URL comes from user input
+    cleaned = url.lstrip(_C0_CONTROL_OR_SPACE).translate(_URL_CHARS_TO_REMOVE)
+    # Fast path for http(s) URLs, same result as the urlparse version below:
+    # drop the fragment and query, then split off the scheme and netloc
+    scheme, sep, rest = cleaned.partition('#')[0].partition('?')[0].partition('://')
+    if sep and scheme.lower() in ('http', 'https'):
+        netloc, slash, path = rest.partition('/')
+        # Bracketed (IPv6) and non-ASCII hosts are left to urlparse, which validates them
+        if netloc.isascii() and '[' not in netloc and ']' not in netloc:
+            # Drop ;parameters from the last path segment, as urlparse does
+            params = path.find(';', path.rfind('/') + 1)
+            if params >= 0:
+                path = path[:params]
+            normalized = f"{scheme}://{netloc}{slash}{path}"
+            if slash:
+                normalized = normalized.rstrip('/')
+            return sys.intern(normalized.lower())
+    try:
+        parsed = urlparse(url)
+        # Remove fragment and query parameters
+        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        # Remove trailing slash except for root path
+        if normalized.endswith('/') and len(normalized) > len(f"{parsed.scheme}://{parsed.netloc}"):
+            normalized = normalized.rstrip('/')
+        return sys.intern(normalized.lower())
+    except Exception:
+        return sys.intern(url.lower())
+
+
+class _HostRateLimiter:
+    """Spaces out request start times to one per `interval` seconds for a single host."""
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the next request slot for this host is available."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self._interval
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class Fetcher:
+    """
+    Downloads pages over one aiohttp session, without parsing them or keeping crawl state.
+    
+    Use it as an async context manager, which opens and closes the session. At most
+    `concurrency` requests are in flight, and requests to the same host start at least
+    `delay` seconds apart.
+    """
+    
+    def __init__(self, timeout: int = 30, delay: float = 1.0, verify_ssl: bool = True, concurrency: int = 16, verbose: bool = False):
         self.timeout = timeout
         self.delay = delay
-        self.verbose = verbose
-        self.recursive = recursive
         self.verify_ssl = verify_ssl
-        self.final_url = url
-        self.visited_urls: Set[str] = set()  # Stores normalized URLs to prevent duplicate visits
-        self.results: List[TrackingItem] = []
-        self._seen_values: Set[str] = set()  # Track seen values to prevent duplicates
+        self.concurrency = max(1, concurrency)
+        self.verbose = verbose
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None  # Created inside the event loop
+        self._rate_limiters: Dict[str, _HostRateLimiter] = {}
+    
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._rate_limiters = {}
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=self.verify_ssl)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # Honour HTTP(S)_PROXY / NO_PROXY like the requests session used for the initial HEAD
+        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout, trust_env=True)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._session.close()
+        self._session = None
+    
+    async def fetch(self, url: str) -> Tuple[Optional[bytes], int, Optional[str]]:
+        """
+        Fetch a page, respecting the concurrency bound and the per-host delay.
         
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL for deduplication by removing fragments, query params, and trailing slashes."""
-        try:
-            parsed = urlparse(url)
-            # Remove fragment and query parameters
-            normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            # Remove trailing slash except for root path
-            if normalized.endswith('/') and len(normalized) > len(f"{parsed.scheme}://{parsed.netloc}"):
-                normalized = normalized.rstrip('/')
-            return normalized.lower()
-        except Exception:
-            return url.lower()
-
-    def _is_duplicate(self, item_type: str, value: str) -> bool:
-        """Check if a value has already been seen (case-insensitive for emails, normalized for phones)."""
-        # For emails, normalize to lowercase for comparison
-        if item_type == "email":
-            normalized_value = value.lower()
-        else:
-            # For phones, normalize by removing all non-digit characters
-            normalized_value = self._normalize_phone_for_dedup(value)
+        Returns the undecoded body, the status code and the charset announced in the headers, if any.
+        The body is None if the response is not a text document (images, PDFs, archives...),
+        which is detected from the Content-Type header before the body is downloaded.
+        """
+        host = urlparse(url).netloc
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            limiter = self._rate_limiters[host] = _HostRateLimiter(self.delay)
         
-        return normalized_value in self._seen_values
-    
-    def _add_result(self, item_type: str, value: str, source_url: str):
-        """Add a result if it's not a duplicate."""
-        if not self._is_duplicate(item_type, value):
-            # For emails, normalize to lowercase for tracking
-            if item_type == "email":
-                self._seen_values.add(value.lower())
-            else:
-                # For phones, normalize by removing all non-digit characters
-                self._seen_values.add(self._normalize_phone_for_dedup(value))
+        async with self._semaphore:
+            await limiter.acquire()
             
-            self.results.append(TrackingItem(
-                type=item_type,
-                value=value,
-                source_url=source_url
-            ))
+            if self.verbose:
+                print(f"Searching: {url}")
+            
+            async with self._session.get(url) as response:
+                if 'Content-Type' in response.headers and not self._is_text_content_type(response.content_type):
+                    return None, response.status, None
+                try:
+                    body = await response.content.readexactly(_MAX_PAGE_BYTES)
+                except asyncio.IncompleteReadError as e:
+                    # The whole body was shorter than the limit
+                    body = e.partial
+                return body, response.status, response.charset
     
-    def _ensure_protocol(self, url: str) -> str:
-        """Ensure URL has a protocol."""
-        if not url.startswith(('http://', 'https://')):
-            return 'https://' + url
-        return url
+    def _is_text_content_type(self, content_type: str) -> bool:
+        """Check if a MIME type is worth parsing (HTML, XML or plain text)."""
+        return content_type.startswith('text/') or 'html' in content_type or 'xml' in content_type
+
+
+class Extractor:
+    """Extracts emails, phone numbers and internal links from HTML pages, without network access or crawl state."""
     
-    def _get_final_url(self, url: str) -> str:
-        """Follow redirects to get the final URL."""
+    def extract(self, html_content: bytes, url: str, charset: Optional[str] = None, find_links: bool = True) -> Dict[str, List[str]]:
+        """
+        Parse a page and extract its emails, phone numbers and internal links.
+        
+        Args:
+            html_content: The raw page body
+            url: The page URL, used to resolve relative links
+            charset: The charset announced by the server, if any
+            find_links: Whether to collect the internal links of the page
+        """
+        tree = self._parse_html(html_content, charset)
+        if tree is None:
+            return {"emails": [], "phones": [], "links": []}
+        
+        # Extract emails and phone numbers from the visible text, one text node at a time
+        emails_from_text, phones = self._extract_contacts(_iter_text_nodes(tree))
+        
+        # Merge with emails from mailto links in the HTML content
+        emails_from_mailto = self._extract_emails_from_mailto(html_content, tree)
+        all_emails = list(dict.fromkeys(chain(emails_from_text, emails_from_mailto)))
+        
+        return {
+            "emails": all_emails,
+            "phones": phones,
+            "links": self._extract_internal_links(tree, url) if find_links else []
+        }
+    
+    def _parse_html(self, html_content: Union[str, bytes], charset: Optional[str] = None) -> Optional[lxml_html.HtmlElement]:
+        """
+        Parse a page with lxml, returning None if it has no content.
+        
+        Raw bytes are decoded with `charset`. Without one, lxml follows a <meta> charset
+        declaration and otherwise the body is read as UTF-8 (lxml would assume Latin-1).
+        """
+        if isinstance(html_content, bytes) and not charset and b'charset' not in html_content[:2048]:
+            charset = 'utf-8'
         try:
-            response = requests.head(url, verify=self.verify_ssl, timeout=self.timeout, allow_redirects=True)
-            return response.url
-        except Exception:
-            return url
+            parser = _html_parser(charset)
+        except LookupError:
+            parser = _html_parser(None)
+        try:
+            return lxml_html.document_fromstring(html_content, parser=parser)
+        except (etree.ParserError, ValueError):
+            return None
     
     def _is_same_domain(self, url: str, base_domain: str) -> bool:
         """Check if URL belongs to the same domain."""
@@ -106,31 +310,38 @@ class Crawler:
         except Exception:
             return False
     
-    def _extract_internal_links(self, soup: BeautifulSoup, base_url: str) -> Set[str]:
-        """Extract internal links from the page."""
-        internal_links = set()
+    def _extract_internal_links(self, tree: lxml_html.HtmlElement, base_url: str) -> List[str]:
+        """Extract internal links from the page, in document order."""
+        internal_links = []
+        # Hrefs already resolved (menus repeat the same links) and links already kept
+        seen_hrefs = set()
+        seen_links = set()
         
         try:
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                if not href:
+            # Parse the page URL once rather than once per link
+            base_netloc = urlparse(base_url).netloc
+            
+            for href in _LINK_HREFS(tree):
+                # Skip anchors on the same page
+                if not href or href[0] == '#' or href in seen_hrefs:
                     continue
+                seen_hrefs.add(href)
                     
                 # Resolve relative URLs
                 absolute_url = urljoin(base_url, href)
+                if absolute_url in seen_links:
+                    continue
                 
-                # Normalize URL for deduplication
-                normalized_url = self._normalize_url(absolute_url)
+                # Filter out non-HTTP schemes (javascript:, mailto:, tel:...), external links,
+                # documents and assets, and account pages
+                parsed = urlparse(absolute_url)
+                if (parsed.scheme not in ('http', 'https') or parsed.netloc != base_netloc
+                        or posixpath.splitext(parsed.path)[1].lower() in _EXCLUDED_EXTENSIONS
+                        or _EXCLUDED_PATH_RE.search(parsed.path) or _EXCLUDED_PATH_RE.search(parsed.query)):
+                    continue
                 
-                # Check if it's an internal link and not already visited (using normalized URL)
-                if self._is_same_domain(absolute_url, base_url) and normalized_url not in self.visited_urls:
-                    # Filter out common non-content URLs
-                    if not any(exclude in absolute_url.lower() for exclude in [
-                        '#', 'javascript:', 'mailto:', 'tel:', '.pdf', '.doc', '.docx', 
-                        '.jpg', '.jpeg', '.png', '.gif', '.css', '.js', '.xml', '.rss',
-                        'logout', 'admin', 'login', 'register', 'signup', 'signin'
-                    ]):
-                        internal_links.add(absolute_url)
+                seen_links.add(absolute_url)
+                internal_links.append(absolute_url)
                         
         except Exception:
             pass
@@ -138,46 +349,45 @@ class Crawler:
         return internal_links
     
     def _extract_emails_from_text(self, text: str) -> List[str]:
-        """Extract emails from text content."""
-        try:
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
-            emails = re.findall(email_pattern, text)
-            # Remove duplicates while preserving order
-            return list(dict.fromkeys(emails))
-        except Exception:
-            return []
+        """Extract emails from text content (the email half of `_extract_contacts`)."""
+        return self._extract_contacts(text)[0]
     
-    def _extract_emails_from_mailto(self, html: str) -> List[str]:
-        """Extract emails from mailto links in HTML content."""
+    def _extract_emails_from_mailto(self, html: Union[str, bytes], tree: Optional[lxml_html.HtmlElement] = None) -> List[str]:
+        """Extract emails from mailto links in HTML content (text or raw bytes), reusing `tree` if it is already parsed."""
         try:
             emails = []
+            seen = set()
             
-            # Extract mailto patterns from the entire content
-            mailto_pattern = r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})'
-            mailto_matches = re.findall(mailto_pattern, html, re.IGNORECASE)
+            # Extract mailto patterns from the entire content, decoding only the matches of raw bytes
+            if isinstance(html, bytes):
+                mailto_matches = [match.decode('ascii') for match in _MAILTO_BYTES_RE.findall(html)]
+                html_markers = (b'<', b'>')
+            else:
+                mailto_matches = _MAILTO_RE.findall(html)
+                html_markers = ('<', '>')
             for email in mailto_matches:
                 email_clean = email.strip()
-                if len(email_clean) <= 100:
+                if len(email_clean) <= 100 and email_clean not in seen:
+                    seen.add(email_clean)
                     emails.append(email_clean)
             
-            # If it looks like HTML, also try to parse it with BeautifulSoup
-            if '<' in html and '>' in html:
+            # If it looks like HTML, also look at the parsed links (hrefs may use HTML entities)
+            if tree is not None or all(marker in html for marker in html_markers):
                 try:
-                    soup = BeautifulSoup(html, 'html.parser')
-                    mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.IGNORECASE))
+                    if tree is None:
+                        tree = self._parse_html(html)
                     
-                    for link in mailto_links:
-                        href = link.get('href', '')
-                        email_match = re.search(r'^mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})', href, re.IGNORECASE)
+                    for href in _MAILTO_HREFS(tree) if tree is not None else ():
+                        email_match = _MAILTO_RE.match(href)
                         if email_match:
                             email = email_match.group(1).strip()
-                            if len(email) <= 100:
+                            if len(email) <= 100 and email not in seen:
+                                seen.add(email)
                                 emails.append(email)
                 except Exception:
                     pass
             
-            # Remove duplicates while preserving order
-            return list(dict.fromkeys(emails))
+            return emails
             
         except Exception:
             return []
@@ -186,134 +396,255 @@ class Crawler:
         """Clean and standardize international phone number format."""
         try:
             # Remove extra whitespace
-            phone = re.sub(r'\s+', ' ', phone.strip())
+            phone = _WHITESPACE_RE.sub(' ', phone.strip())
             # Normalize separators - replace dashes, dots, and multiple spaces with a single space
-            phone = re.sub(r'[-.]+', ' ', phone)
-            phone = re.sub(r'\s+', ' ', phone)
+            phone = _SEPARATORS_RE.sub(' ', phone)
+            phone = _WHITESPACE_RE.sub(' ', phone)
             # Remove parentheses but keep the content
-            phone = re.sub(r'[()]', '', phone)
+            phone = _PARENTHESES_RE.sub('', phone)
             # Clean up any remaining extra spaces
-            phone = re.sub(r'\s+', ' ', phone).strip()
+            phone = _WHITESPACE_RE.sub(' ', phone).strip()
             return phone
         except Exception:
             return phone
-
+    
     def _normalize_phone_for_dedup(self, phone: str) -> str:
         """Normalize phone number for deduplication by removing all non-digit characters."""
         try:
             # Remove all non-digit characters for comparison
-            digits_only = re.sub(r'[^\d]', '', phone)
+            digits_only = phone.translate(_DIGITS_ONLY)
             return digits_only
         except Exception:
             return phone
-
+    
     def _extract_phones(self, text: str) -> List[str]:
-        """Extract phone numbers from text content."""
+        """Extract phone numbers from text content (the phone half of `_extract_contacts`)."""
+        return self._extract_contacts(text)[1]
+    
+    def _format_phone(self, kind: str, phone: str) -> str:
+        """Format a phone number matched by the given `_CONTACT_RE` branch."""
+        if kind == "intl":
+            return self._clean_international_phone(phone)
+        # US numbers, with or without country code: keep the last 10 digits
+        digits = phone.translate(_DIGITS_ONLY)[-10:]
+        return f"+1-{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    
+    def _extract_contacts(self, text: Union[str, Iterable[str]]) -> Tuple[List[str], List[str]]:
+        """
+        Extract emails and phone numbers from text content in a single pass.
+        
+        `text` can also be an iterable of text chunks (e.g. the text nodes of a page),
+        which are scanned one at a time instead of being joined into one large string.
+        """
         try:
+            emails = []
             phones = []
-            # Patterns for US and international numbers
-            patterns = [
-                # US phone numbers with country code
-                r'\b\+1[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-                # US phone numbers without country code (but with context)
-                r'\b\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-                # International format: +country (area) xx xx xx ...
-                r'\+(\d{1,4})[\s.-]?(\(?\d{1,4}\)?[\s.-]?){2,6}\d{2,4}\b',
-            ]
-            for idx, pattern in enumerate(patterns):
-                for match_obj in re.finditer(pattern, text, re.IGNORECASE):
-                    original_match = match_obj.group(0)
-                    if self._is_valid_phone(original_match, text):
-                        if idx == 0:  # US with country code
-                            groups = match_obj.groups()
-                            if len(groups) == 3:
-                                phone = f"+1-{groups[0]}-{groups[1]}-{groups[2]}"
-                            else:
-                                phone = original_match
-                        elif idx == 1:  # US without country code
-                            groups = match_obj.groups()
-                            if len(groups) == 3:
-                                phone = f"+1-{groups[0]}-{groups[1]}-{groups[2]}"
-                            else:
-                                phone = original_match
-                        else:  # International
-                            phone = self._clean_international_phone(original_match)
-                        phones.append(phone)
-            return list(dict.fromkeys(phones))
+            # Raw matches already handled, so repeated numbers are only validated and formatted once
+            seen_matches = set()
+            seen_phones = set()
+            chunks = (text,) if isinstance(text, str) else text
+            for chunk in chunks:
+                # Most text nodes hold neither an email nor a phone number: skip them
+                # without running the regex when they have no '@' and too few digits
+                if len(chunk) < _MIN_CONTACT_LENGTH or ('@' not in chunk and len(chunk.translate(_DIGITS_ONLY)) < _MIN_PHONE_DIGITS):
+                    continue
+                for match_obj in _CONTACT_RE.finditer(chunk):
+                    value = match_obj.group()
+                    if value in seen_matches:
+                        continue
+                    seen_matches.add(value)
+                    kind = match_obj.lastgroup
+                    if kind == "email":
+                        emails.append(value)
+                    elif self._is_valid_phone(value, chunk):
+                        phone = self._format_phone(kind, value)
+                        if phone not in seen_phones:
+                            seen_phones.add(phone)
+                            phones.append(phone)
+            return emails, phones
         except Exception:
-            return []
+            return [], []
     
     def _is_valid_phone(self, phone: str, context: str = "") -> bool:
         """Validate if a phone number is reasonable."""
         try:
             # Remove common separators and get just digits
-            digits = re.sub(r'[^\d]', '', phone)
+            digits = phone.translate(_DIGITS_ONLY)
             # Must have 10-15 digits (reasonable for phone numbers)
-            if len(digits) < 10 or len(digits) > 15:
+            if len(digits) < _MIN_PHONE_DIGITS or len(digits) > 15:
                 return False
             # Reject if the phone value is just a sequence of digits (no separators)
-            if re.fullmatch(r'\d{10,15}', phone):
+            if len(digits) == len(phone):
                 return False
             # Require at least one separator (space, dash, dot, parenthesis, or plus)
-            if not re.search(r'[\s\-\.\(\)\+]', phone):
+            if not _PHONE_SEPARATOR_RE.search(phone):
                 return False
             # For international numbers, require at least one separator after the country code
             if phone.startswith('+'):
                 # Remove the country code
-                m = re.match(r'(\+\d{1,4})(.*)', phone)
+                m = _COUNTRY_CODE_RE.match(phone)
                 if m:
                     after_cc = m.group(2)
                     # There must be at least one separator in the rest of the number
-                    if not re.search(r'[\s\-\.\(\)]', after_cc):
+                    if not _NUMBER_SEPARATOR_RE.search(after_cc):
                         return False
             return True
         except Exception:
             return False
+
+
+# Stateless extractor whose bound methods are sent to worker processes
+_POOL_EXTRACTOR = Extractor()
+
+
+class Crawler(Extractor):
+    """A web crawler that extracts emails and phone numbers from websites."""
+    
+    def __init__(self, url: str, max_pages: int = 50, timeout: int = 30, delay: float = 1.0, verbose: bool = False, recursive: bool = False, verify_ssl: bool = True, concurrency: int = 16, workers: int = 0):
+        """
+        Initialize the crawler.
+        
+        Args:
+            url: The URL to crawl
+            max_pages: Maximum number of pages to crawl
+            timeout: Request timeout in seconds
+            delay: Minimum delay between two requests to the same host in seconds
+            verbose: Print every page being searched
+            recursive: Follow every internal link (default: only crawl the final page after redirects)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            concurrency: Maximum number of pages fetched at the same time
+            workers: Number of processes used to parse pages (default: 0, parse in the main process)
+        """
+        self.url = url
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.delay = delay
+        self.verbose = verbose
+        self.recursive = recursive
+        self.verify_ssl = verify_ssl
+        self.concurrency = max(1, concurrency)
+        self.workers = max(0, workers)
+        self.final_url = url
+        self.visited_urls: Set[str] = set()  # Stores normalized URLs to prevent duplicate visits
+        self.enqueued_urls: Set[str] = set()  # Normalized URLs ever queued for crawling, a superset of visited_urls
+        self.results: List[TrackingItem] = []
+        self._seen_emails: Set[str] = set()  # Lowercased emails already in results
+        self._seen_phone_digits: Set[str] = set()  # Digits of phone numbers already in results
+        self._content_signatures: Set[bytes] = set()  # Hashes of page bodies already processed
+        self._session = self._create_session()  # Keep-alive session for synchronous requests
+        self._pool: Optional[ProcessPoolExecutor] = None  # Parses pages when workers > 0
+        
+    def _create_session(self) -> requests.Session:
+        """Create a requests session with connection pooling and retries on transient errors."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def close(self):
+        """Close the connections kept open by the crawler's session."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
     
-    def _process_page(self, url: str) -> Dict[str, List[str]]:
-        """Process a single page and extract emails and phones."""
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    # Normalize URL for deduplication by removing fragments, query params, and trailing slashes.
+    # The memoized function is shared by all crawlers, and its cache_clear() is reachable from here.
+    _normalize_url = staticmethod(_normalize_url_cached)
+
+    def _is_duplicate(self, item_type: str, value: str) -> bool:
+        """Check if a value has already been seen (case-insensitive for emails, normalized for phones)."""
+        if item_type == "email":
+            return value.lower() in self._seen_emails
+        # For phones, normalize by removing all non-digit characters
+        return self._normalize_phone_for_dedup(value) in self._seen_phone_digits
+    
+    def _add_result(self, item_type: str, value: str, source_url: str):
+        """Add a result if it's not a duplicate."""
+        if item_type == "email":
+            self._merge_page_results(source_url, [value], [])
+        else:
+            self._merge_page_results(source_url, [], [value])
+    
+    def _merge_page_results(self, page_url: str, emails: List[str], phones: List[str]):
+        """Add the emails and phone numbers found on a page, skipping values already seen."""
+        results = self.results
+        
+        # Emails are compared case-insensitively
+        seen_emails = self._seen_emails
+        for email in emails:
+            key = email.lower()
+            if key not in seen_emails:
+                seen_emails.add(key)
+                results.append(TrackingItem(type="email", value=email, source_url=page_url))
+        
+        # Phones are compared on their digits only
+        seen_phone_digits = self._seen_phone_digits
+        for phone in phones:
+            key = self._normalize_phone_for_dedup(phone)
+            if key not in seen_phone_digits:
+                seen_phone_digits.add(key)
+                results.append(TrackingItem(type="phone", value=phone, source_url=page_url))
+    
+    def _ensure_protocol(self, url: str) -> str:
+        """Ensure URL has a protocol."""
+        if not url.startswith(('http://', 'https://')):
+            return 'https://' + url
+        return url
+    
+    def _get_final_url(self, url: str) -> str:
+        """Follow redirects to get the final URL."""
+        try:
+            response = self._session.head(url, verify=self.verify_ssl, timeout=self.timeout, allow_redirects=True)
+            return response.url
+        except Exception:
+            return url
+    
+    async def _process_page(self, fetcher: Fetcher, url: str, find_links: bool = False) -> Dict[str, List[str]]:
+        """Process a single page and extract emails, phones and, if requested, internal links."""
         try:
-            # Add delay to be respectful to the server
-            if len(self.visited_urls) > 0:
-                time.sleep(self.delay)
-            
-            if self.verbose:
-                print(f"Searching: {url}")
-            
             # Get the page
-            response = requests.get(url, verify=self.verify_ssl, timeout=self.timeout)
+            html_content, status, charset = await fetcher.fetch(url)
             
             # Only proceed if we get a 200 status code
-            if response.status_code != 200:
+            if status != 200:
                 if self.verbose:
-                    print(f"❌ Skipping {url}: HTTP {response.status_code}")
-                return {"emails": [], "phones": []}
+                    print(f"❌ Skipping {url}: HTTP {status}")
+                return {"emails": [], "phones": [], "links": []}
             
-            # Parse HTML content
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            visible_text = soup.get_text(separator=' ')
+            if html_content is None:
+                if self.verbose:
+                    print(f"⏭️ Skipping {url}: not a text document")
+                return {"emails": [], "phones": [], "links": []}
             
-            # Extract emails from both HTML content and visible text
-            emails_from_text = self._extract_emails_from_text(visible_text)
-            emails_from_mailto = self._extract_emails_from_mailto(html_content)
-            all_emails = list(dict.fromkeys(emails_from_text + emails_from_mailto))
+            # Skip pages whose body was already processed under another URL
+            signature = hashlib.blake2b(html_content, digest_size=8).digest()
+            if signature in self._content_signatures:
+                if self.verbose:
+                    print(f"⏭️ Skipping {url}: same content as a page already processed")
+                return {"emails": [], "phones": [], "links": []}
+            self._content_signatures.add(signature)
             
-            # Extract phone numbers
-            phones = self._extract_phones(visible_text)
+            # Parsing is CPU-bound: hand it to the worker processes if there are any
+            if self._pool is not None:
+                loop = asyncio.get_running_loop()
+                page_data = await loop.run_in_executor(self._pool, _POOL_EXTRACTOR.extract, html_content, url, charset, find_links)
+            else:
+                page_data = self.extract(html_content, url, charset, find_links)
             
-            if self.verbose and (all_emails or phones):
-                print(f"✅ Found on {url}: {len(all_emails)} emails, {len(phones)} phones")
+            if self.verbose and (page_data["emails"] or page_data["phones"]):
+                print(f"✅ Found on {url}: {len(page_data['emails'])} emails, {len(page_data['phones'])} phones")
             
-            return {
-                "emails": all_emails,
-                "phones": phones
-            }
+            return page_data
             
         except Exception as e:
             if self.verbose:
                 print(f"❌ Error processing {url}: {str(e)}")
-            return {"emails": [], "phones": []}
+            return {"emails": [], "phones": [], "links": []}
     
     def fetch(self):
         """Fetch the initial URL and follow redirects."""
@@ -341,57 +672,54 @@ class Crawler:
         if not self.final_url:
             raise RuntimeError("Must call fetch() before extracting data")
         
-        if self.recursive:
-            # Recursive mode: crawl multiple pages
-            urls_to_visit = {self.final_url}
+        if self.workers:
+            # Workers are started lazily from inside the event loop, once aiohttp's resolver threads
+            # exist; forking a multi-threaded process can deadlock, so start them fresh instead
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            asyncio.run(self._crawl_and_extract_async())
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+    
+    async def _crawl_and_extract_async(self):
+        """Crawl pages concurrently, breadth-first, until max_pages is reached."""
+        async with Fetcher(self.timeout, self.delay, self.verify_ssl, self.concurrency, self.verbose) as fetcher:
+            # FIFO queue for a breadth-first crawl; links are deduplicated when they are queued,
+            # so every queued URL is unvisited. Non-recursive mode only crawls the final page
+            urls_to_visit = deque()
+            enqueued_urls = self.enqueued_urls
+            visited_urls = self.visited_urls
+            normalized_url = self._normalize_url(self.final_url)
+            if normalized_url not in enqueued_urls and normalized_url not in visited_urls:
+                enqueued_urls.add(normalized_url)
+                urls_to_visit.append(self.final_url)
+            max_pages = self.max_pages if self.recursive else 1
             page_count = 0
             
-            while urls_to_visit and page_count < self.max_pages:
-                current_url = urls_to_visit.pop()
+            while urls_to_visit and page_count < max_pages:
+                # Take the next batch of unvisited pages, up to the page budget
+                batch = []
+                while urls_to_visit and page_count + len(batch) < max_pages:
+                    current_url = urls_to_visit.popleft()
+                    visited_urls.add(self._normalize_url(current_url))
+                    batch.append(current_url)
                 
-                # Normalize URL for deduplication
-                normalized_url = self._normalize_url(current_url)
+                page_count += len(batch)
+                # Only collect internal links while there is page budget left to follow them
+                find_links = self.recursive and page_count < max_pages
+                pages = await asyncio.gather(*(self._process_page(fetcher, url, find_links) for url in batch))
                 
-                if normalized_url in self.visited_urls:
-                    continue
+                for current_url, page_data in zip(batch, pages):
+                    self._merge_page_results(current_url, page_data["emails"], page_data["phones"])
                     
-                self.visited_urls.add(normalized_url)
-                page_count += 1
-                
-                # Process the page
-                page_data = self._process_page(current_url)
-                
-                # Add emails to results
-                for email in page_data["emails"]:
-                    self._add_result("email", email, current_url)
-                
-                # Add phones to results
-                for phone in page_data["phones"]:
-                    self._add_result("phone", phone, current_url)
-                
-                # Extract internal links for further crawling
-                if page_count < self.max_pages:
-                    try:
-                        response = requests.get(current_url, verify=self.verify_ssl, timeout=self.timeout)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            new_links = self._extract_internal_links(soup, current_url)
-                            urls_to_visit.update(new_links)
-                    except Exception:
-                        continue
-        else:
-            # Non-recursive mode: only crawl the final page
-            normalized_url = self._normalize_url(self.final_url)
-            self.visited_urls.add(normalized_url)
-            page_data = self._process_page(self.final_url)
-            
-            # Add emails to results
-            for email in page_data["emails"]:
-                self._add_result("email", email, self.final_url)
-            
-            # Add phones to results
-            for phone in page_data["phones"]:
-                self._add_result("phone", phone, self.final_url)
+                    # Queue internal links for further crawling
+                    for link in page_data["links"]:
+                        normalized_link = self._normalize_url(link)
+                        if normalized_link not in enqueued_urls and normalized_link not in visited_urls:
+                            enqueued_urls.add(normalized_link)
+                            urls_to_visit.append(link)
     
     def get_results(self) -> List[TrackingItem]:
         """Get the extracted results (already deduplicated)."""
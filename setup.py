@@ -8,13 +8,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
-        "beautifulsoup4",
+        "aiohttp>=3.9",
         "lxml",
     ],
+    extras_require={
+        "re2": ["google-re2"],
+    },
     entry_points={
         "console_scripts": [
             "reconcrawl=reconcrawl.cli:cli",
         ],
     },
-    python_requires=">=3.6",
+    python_requires=">=3.8",
 )
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import urlsplit
+from reconcrawl import Crawler, Fetcher
+
+
+PAGES = {
+    "/": '<html><body><a href="/contact">Contact</a> <a href="/about/">About</a>'
+         '<a href="https://other.com/">Other</a></body></html>',
+    "/contact": '<html><body><p>Mail us: <a href="mailto:sales@example.com">Sales</a></p>'
+                '<p>Call (555) 123-4567</p><a href="/">Home</a></body></html>',
+    "/about": '<html><body><p>Write to info@example.com</p><a href="/contact#form">Contact</a>'
+              '<a href="/index.html">Home</a></body></html>',
+}
+PAGES["/index.html"] = PAGES["/"]
+PAGES["/download"] = 'Binary data with a stray address: sales@example.com'
+CONTENT_TYPES = {"/download": "application/octet-stream"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = Counter()
+    starts = []
+
+    def do_GET(self):
+        # Requests sent through a proxy carry the absolute URL
+        path = urlsplit(self.path).path.rstrip("/") or "/"
+        self.hits[path] += 1
+        self.starts.append((self.headers["Host"].split(":")[0], time.monotonic()))
+        body = PAGES.get(path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES.get(path, "text/html; charset=utf-8"))
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCrawl(unittest.TestCase):
+    """Test crawling against a local HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.hits.clear()
+        _Handler.starts.clear()
+
+    def test_recursive_crawl(self):
+        """Test that a recursive crawl finds items on every internal page and fetches each page once."""
+        crawler = Crawler(self.base_url, recursive=True, delay=0)
+        crawler.extract_emails()
+
+        values = {item.value: item.source_url for item in crawler.get_results()}
+        self.assertEqual(values["sales@example.com"], self.base_url + "contact")
+        self.assertEqual(values["info@example.com"], self.base_url + "about/")
+        self.assertIn("+1-555-123-4567", values)
+        self.assertEqual(len(crawler.visited_urls), 4)
+        self.assertEqual(crawler.visited_urls, crawler.enqueued_urls)
+        self.assertEqual(set(_Handler.hits.values()), {1})
+        # /index.html has the same body as / and is not processed twice
+        self.assertEqual(len(crawler._content_signatures), 3)
+
+    def test_recursive_crawl_with_workers(self):
+        """Test that parsing pages in worker processes gives the same results."""
+        crawler = Crawler(self.base_url, recursive=True, delay=0, workers=2)
+        crawler.extract_emails()
+
+        expected = Crawler(self.base_url, recursive=True, delay=0)
+        expected.extract_emails()
+        self.assertEqual(crawler.get_results(), expected.get_results())
+        self.assertIsNone(crawler._pool)
+
+    def test_non_recursive_crawl(self):
+        """Test that only the final page is crawled when not recursive."""
+        crawler = Crawler(self.base_url + "contact", delay=0)
+        crawler.extract_emails()
+
+        self.assertEqual([item.value for item in crawler.get_results()], ["sales@example.com", "+1-555-123-4567"])
+        self.assertEqual(dict(_Handler.hits), {"/contact": 1})
+
+    def test_non_text_page(self):
+        """Test that responses that are not text documents are not parsed."""
+        crawler = Crawler(self.base_url + "download", delay=0)
+        crawler.extract_emails()
+
+        self.assertEqual(crawler.get_results(), [])
+        self.assertEqual(dict(_Handler.hits), {"/download": 1})
+
+    def test_page_size_limit(self):
+        """Test that pages are truncated past the maximum page size."""
+        crawler = Crawler(self.base_url + "contact", delay=0)
+        with patch("reconcrawl.extractor._MAX_PAGE_BYTES", 20):
+            crawler.extract_emails()
+
+        self.assertEqual(crawler.get_results(), [])
+
+    def test_fetcher(self):
+        """Test that the fetcher returns raw bodies of text documents only."""
+        async def fetch_all(urls):
+            async with Fetcher(delay=0) as fetcher:
+                return await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+
+        contact, download, missing = asyncio.run(fetch_all([self.base_url + path for path in ("contact", "download", "missing")]))
+        self.assertEqual(contact, (PAGES["/contact"].encode("utf-8"), 200, "utf-8"))
+        self.assertEqual(download, (None, 200, None))
+        self.assertEqual(missing[1], 404)
+
+    def test_fetcher_uses_proxy_from_environment(self):
+        """Test that the fetcher honours HTTP_PROXY, like the requests session does."""
+        async def fetch(url):
+            async with Fetcher(delay=0) as fetcher:
+                return await fetcher.fetch(url)
+
+        with patch.dict(os.environ, {"HTTP_PROXY": self.base_url, "http_proxy": self.base_url, "NO_PROXY": "", "no_proxy": ""}):
+            body, status, _ = asyncio.run(fetch("http://proxied.invalid/contact"))
+        self.assertEqual(status, 200)
+        self.assertEqual(body, PAGES["/contact"].encode("utf-8"))
+
+    def test_fetcher_delay_per_host(self):
+        """Test that requests to one host start `delay` apart while other hosts are not held back."""
+        async def fetch_all(urls):
+            async with Fetcher(delay=0.2) as fetcher:
+                await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+
+        other_url = self.base_url.replace("127.0.0.1", "localhost")
+        asyncio.run(fetch_all([self.base_url + "contact"] * 3 + [other_url + "contact"] * 2))
+
+        starts = {}
+        for host, started in _Handler.starts:
+            starts.setdefault(host, []).append(started)
+        self.assertEqual({host: len(times) for host, times in starts.items()}, {"127.0.0.1": 3, "localhost": 2})
+        for times in starts.values():
+            for previous, current in zip(times, times[1:]):
+                self.assertGreaterEqual(current - previous, 0.15)
+        self.assertLess(abs(starts["localhost"][0] - starts["127.0.0.1"][0]), 0.15)
+
+    def test_max_pages(self):
+        """Test that the crawl stops at max_pages, visiting links breadth-first in document order."""
+        crawler = Crawler(self.base_url, recursive=True, delay=0, max_pages=2)
+        crawler.extract_emails()
+
+        self.assertEqual(len(crawler.visited_urls), 2)
+        self.assertEqual(dict(_Handler.hits), {"/": 1, "/contact": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
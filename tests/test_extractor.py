@@ -1,6 +1,9 @@
+import sys
 import unittest
 from unittest.mock import patch, Mock
+from lxml import html as lxml_html
 from reconcrawl import Crawler, TrackingItem
+from reconcrawl.extractor import _compile_scanner
 
 
 class TestCrawler(unittest.TestCase):
@@ -16,6 +19,14 @@ class TestCrawler(unittest.TestCase):
         self.assertEqual(len(crawler.visited_urls), 0)
         self.assertEqual(len(crawler.results), 0)
     
+    def test_context_manager(self):
+        """Test that the crawler closes its session when used as a context manager."""
+        with patch('requests.Session.close') as mock_close:
+            with Crawler("https://example.com") as crawler:
+                self.assertIsInstance(crawler, Crawler)
+                mock_close.assert_not_called()
+        mock_close.assert_called_once()
+    
     def test_ensure_protocol(self):
         """Test URL protocol handling."""
         crawler = Crawler("example.com")
@@ -32,6 +43,45 @@ class TestCrawler(unittest.TestCase):
         self.assertIn("support@test.com", emails)
         self.assertEqual(len(emails), 2)
     
+    def test_extract(self):
+        """Test extraction from a raw page body, ignoring scripts and comments and decoding with the page charset."""
+        crawler = Crawler("https://example.com")
+        html = ('<html><head><script>var x = "dev@example.com";</script></head><body>'
+                '<p>Caf\u00e9: 555\u00a0123\u00a04567, info@example.com</p><a href="/contact">Contact</a>'
+                '<!-- old@example.com --> sales@example.com</body></html>')
+        expected = {"emails": ["info@example.com", "sales@example.com"], "phones": ["+1-555-123-4567"], "links": ["https://example.com/contact"]}
+        self.assertEqual(crawler.extract(html.encode("utf-8"), "https://example.com/"), expected)
+        self.assertEqual(crawler.extract(html.encode("cp1252"), "https://example.com/", charset="cp1252"), expected)
+        self.assertEqual(crawler.extract(b"", "https://example.com/"), {"emails": [], "phones": [], "links": []})
+    
+    def test_extract_internal_links(self):
+        """Test internal link discovery and filtering."""
+        crawler = Crawler("https://example.com")
+        html = ('<a href="/">Home</a><a href="/about">About</a><a href="team.html">Team</a>'
+                '<a href="/about/">About again</a><a href="https://other.com/page">Other</a>'
+                '<a href="/brochure.PDF">PDF</a><a href="/app.js?v=2">JS</a><a href="/login">Login</a>'
+                '<a href="#top">Top</a><a href="mailto:a@example.com">Mail</a><a href="/docs.html">Docs</a>'
+                '<a href="/wp-login.php">WP</a><a href="/index.php?action=logout">Logout</a><a href="javascript:void(0)">JS</a>'
+                '<a href="/administration">Administration</a><a href="/team.html#jobs">Jobs</a>'
+                '<a href="ftp://example.com/file">FTP</a>')
+        links = crawler._extract_internal_links(lxml_html.document_fromstring(html), "https://example.com/")
+        self.assertEqual(links, ["https://example.com/", "https://example.com/about", "https://example.com/team.html",
+                                 "https://example.com/about/", "https://example.com/docs.html",
+                                 "https://example.com/administration", "https://example.com/team.html#jobs"])
+    
+    def test_extract_emails_from_mailto(self):
+        """Test email extraction from mailto links, with and without a pre-parsed page."""
+        crawler = Crawler("https://example.com")
+        html = '<a href="mailto:sales@example.com">Sales</a> <a href="mailto:info&#64;example.com">Info</a>'
+        expected = ["sales@example.com", "info@example.com"]
+        self.assertEqual(crawler._extract_emails_from_mailto(html), expected)
+        self.assertEqual(crawler._extract_emails_from_mailto(html, lxml_html.document_fromstring(html)), expected)
+        self.assertEqual(crawler._extract_emails_from_mailto(html.encode()), expected)
+        # Non-ASCII letters that fold to ASCII ones (Kelvin sign, long s) are not part of an address
+        html = '<p>MAILTO:\u212aevin@x.com mailto:\u017fales@x.com</p><a href="mailto:info@example.com">Info</a>'
+        self.assertEqual(crawler._extract_emails_from_mailto(html.encode()), ["info@example.com"])
+        self.assertIn("info@example.com", crawler.extract(html.encode(), "https://example.com/")["emails"])
+    
     def test_extract_phones(self):
         """Test phone number extraction."""
         crawler = Crawler("https://example.com")
@@ -39,6 +89,28 @@ class TestCrawler(unittest.TestCase):
         phones = crawler._extract_phones(text)
         self.assertIn("+1-555-123-4567", phones)
         self.assertIn("+1-555-987-6543", phones)
+        # Digits inside an international number are not also reported as a US number
+        self.assertEqual(crawler._extract_phones("Call +44 207 946 0958"), ["+44 207 946 0958"])
+    
+    def test_extract_contacts(self):
+        """Test single-pass email and phone extraction."""
+        crawler = Crawler("https://example.com")
+        text = "Write to sales@example.com, call +1 416 123 4567, (555) 123-4567 or +44 20 7946 0958. Order #1234567890"
+        emails, phones = crawler._extract_contacts(text)
+        self.assertEqual(emails, ["sales@example.com"])
+        self.assertEqual(phones, ["+1-416-123-4567", "+1-555-123-4567", "+44 20 7946 0958"])
+        # Text can be scanned chunk by chunk, e.g. one text node at a time
+        self.assertEqual(crawler._extract_contacts(["Mail ", "sales@example.com", "or call (555) 123-4567"]),
+                         (["sales@example.com"], ["+1-555-123-4567"]))
+        # Non-breaking spaces are separators too, whichever regex engine is used
+        self.assertEqual(crawler._extract_contacts("Call 555\xa0123\xa04567")[1], ["+1-555-123-4567"])
+    
+    def test_compile_scanner_fallback(self):
+        """Test that patterns RE2 rejects are compiled with re from the original pattern."""
+        # RE2 has no lookbehind, so this pattern always ends up compiled with re
+        scanner = _compile_scanner(r'(?<=x)\d+\s?')
+        self.assertEqual(scanner.pattern, r'(?<=x)\d+\s?')
+        self.assertEqual(scanner.findall("x12 y34 x5\u00a0"), ["12 ", "5\u00a0"])
     
     def test_tracking_item(self):
         """Test TrackingItem dataclass."""
@@ -46,8 +118,10 @@ class TestCrawler(unittest.TestCase):
         self.assertEqual(item.type, "email")
         self.assertEqual(item.value, "test@example.com")
         self.assertEqual(item.source_url, "https://example.com/contact")
+        if sys.version_info >= (3, 10):
+            self.assertFalse(hasattr(item, "__dict__"))
     
-    @patch('requests.head')
+    @patch('requests.Session.head')
     def test_get_final_url(self, mock_head):
         """Test final URL resolution."""
         mock_response = Mock()
@@ -124,9 +198,9 @@ class TestCrawler(unittest.TestCase):
         self.assertIn("+61 2 1234 5678", crawler._extract_phones("Sydney: +61 2 1234 5678"))
         self.assertIn("+61 2 1234 5678", crawler._extract_phones("Australia: +61.2.1234.5678"))
         
-        # Canadian numbers (+1) - different from US
-        self.assertIn("+1 416 123 4567", crawler._extract_phones("Toronto: +1 416 123 4567"))
-        self.assertIn("+1 416 123 4567", crawler._extract_phones("Canada: +1.416.123.4567"))
+        # Canadian numbers (+1) are reported in the same +1-XXX-XXX-XXXX format as US numbers
+        self.assertEqual(crawler._extract_phones("Toronto: +1 416 123 4567"), ["+1-416-123-4567"])
+        self.assertEqual(crawler._extract_phones("Canada: +1.416.123.4567"), ["+1-416-123-4567"])
         
         # Numbers with parentheses
         self.assertIn("+33 1 42 86 12 34", crawler._extract_phones("Paris: +33 (1) 42 86 12 34"))
@@ -150,6 +224,13 @@ class TestCrawler(unittest.TestCase):
         self.assertEqual(crawler._clean_international_phone("+44.20.7946.0958"), "+44 20 7946 0958")
         self.assertEqual(crawler._clean_international_phone("+44-20-7946-0958"), "+44 20 7946 0958")
 
+    def test_normalize_phone_for_dedup(self):
+        """Test that phone normalization keeps decimal digits only."""
+        crawler = Crawler("https://example.com")
+        self.assertEqual(crawler._normalize_phone_for_dedup("+1 (555) 123-4567"), "15551234567")
+        self.assertEqual(crawler._normalize_phone_for_dedup("555\xa0123\xa04567"), "5551234567")
+        self.assertEqual(crawler._normalize_phone_for_dedup("tel: 555.123.4567"), "5551234567")
+
     def test_deduplication(self):
         """Test that duplicates are properly removed."""
         crawler = Crawler("https://example.com")
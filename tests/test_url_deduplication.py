@@ -2,49 +2,72 @@ import unittest
 from reconcrawl.extractor import Crawler
 
 
+# Test cases: (url1, url2, should_be_duplicate)
+URL_NORMALIZATION_CASES = (
+    # Same URL with different trailing slashes
+    ("https://example.com/page", "https://example.com/page/", True),
+    
+    # Same URL with different fragments
+    ("https://example.com/page", "https://example.com/page#section", True),
+    
+    # Same URL with different query parameters
+    ("https://example.com/page", "https://example.com/page?param=value", True),
+    
+    # Same URL with different cases
+    ("https://example.com/Page", "https://example.com/page", True),
+    
+    # Same URL with path parameters (e.g. session IDs)
+    ("https://example.com/page", "https://example.com/page;jsessionid=ABC", True),
+    
+    # Same URL with leading whitespace or embedded tabs and newlines, which urlparse drops
+    ("https://example.com/page", " https://example.com/page", True),
+    ("https://example.com/page", "https://example.com/pa\tge\n", True),
+    
+    # Different URLs
+    ("https://example.com/page1", "https://example.com/page2", False),
+    
+    # Same URL with different protocols (should be treated as different for security)
+    ("http://example.com/page", "https://example.com/page", False),
+    
+    # Same URL with different ports (should be treated as different)
+    ("https://example.com/page", "https://example.com:443/page", False),
+)
+
+
 class TestURLDeduplication(unittest.TestCase):
     """Test URL deduplication functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up a crawler instance shared by the tests."""
+        cls.crawler = Crawler("https://example.com", recursive=True, verbose=False)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.crawler.close()
+    
     def setUp(self):
-        """Set up test crawler instance."""
-        self.crawler = Crawler("https://example.com", recursive=True, verbose=False)
+        """Start each test with no visited URLs."""
+        self.crawler.visited_urls.clear()
+    
+    def tearDown(self):
+        """Clear the URL normalization cache so each test starts cold."""
+        Crawler._normalize_url.cache_clear()
     
     def test_url_normalization(self):
         """Test that URLs are properly normalized for deduplication."""
-        # Test cases: (url1, url2, should_be_duplicate)
-        test_cases = [
-            # Same URL with different trailing slashes
-            ("https://example.com/page", "https://example.com/page/", True),
-            
-            # Same URL with different fragments
-            ("https://example.com/page", "https://example.com/page#section", True),
-            
-            # Same URL with different query parameters
-            ("https://example.com/page", "https://example.com/page?param=value", True),
-            
-            # Same URL with different cases
-            ("https://example.com/Page", "https://example.com/page", True),
-            
-            # Different URLs
-            ("https://example.com/page1", "https://example.com/page2", False),
-            
-            # Same URL with different protocols (should be treated as different for security)
-            ("http://example.com/page", "https://example.com/page", False),
-            
-            # Same URL with different ports (should be treated as different)
-            ("https://example.com/page", "https://example.com:443/page", False),
-        ]
-        
-        for url1, url2, should_be_duplicate in test_cases:
-            normalized1 = self.crawler._normalize_url(url1)
-            normalized2 = self.crawler._normalize_url(url2)
-            
-            if should_be_duplicate:
-                self.assertEqual(normalized1, normalized2, 
-                               f"URLs should be normalized to same value: {url1} vs {url2}")
-            else:
-                self.assertNotEqual(normalized1, normalized2, 
-                                  f"URLs should be normalized to different values: {url1} vs {url2}")
+        for url1, url2, should_be_duplicate in URL_NORMALIZATION_CASES:
+            with self.subTest(url1=url1, url2=url2):
+                normalized1 = self.crawler._normalize_url(url1)
+                normalized2 = self.crawler._normalize_url(url2)
+                
+                if should_be_duplicate:
+                    # Normalized URLs are interned, so aliases share one string
+                    self.assertIs(normalized1, normalized2,
+                                  f"URLs should be normalized to same value: {url1} vs {url2}")
+                else:
+                    self.assertNotEqual(normalized1, normalized2, 
+                                      f"URLs should be normalized to different values: {url1} vs {url2}")
     
     def test_visited_urls_deduplication(self):
         """Test that the visited_urls set properly prevents duplicate visits."""